@@ -17,15 +17,8 @@ Game::Game() {
     speechBubbleTexture = LoadTexture(AssetPath::SPEECH_BUBBLE);
     // If the asset is missing, create a simple placeholder so bubbles still render
     if (speechBubbleTexture.width == 0 || speechBubbleTexture.height == 0) {
-        // generate a small placeholder image (32x24) with a white rounded-ish rectangle
-        Image img = GenImageColor(32, 24, BLANK);
-        // fill with white background
-        Color bg = WHITE;
-        for (int y = 0; y < 24; ++y) {
-            for (int x = 0; x < 32; ++x) {
-                ImageDrawPixel(&img, x, y, bg);
-            }
-        }
+        // generate a small white placeholder image (32x24) in one fill, no per-pixel draw loop
+        Image img = GenImageColor(32, 24, WHITE);
         speechBubbleTexture = LoadTextureFromImage(img);
         UnloadImage(img);
     }